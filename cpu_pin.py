@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 import sys
 import os
+import collections
+import functools
+import glob
 import json
+import pwd
+import re
 import subprocess
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
 
 import psutil
 from PyQt6 import QtCore, QtWidgets
@@ -11,22 +17,80 @@ from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont, QAction
 
 
 CONFIG_PATH = os.path.expanduser("~/.cpu_affinity_manager.json")
+TOPOLOGY_CACHE_PATH = os.path.expanduser("~/.cache/cpu_affinity_topology.json")
+SYSFS_CPU_DIR = "/sys/devices/system/cpu"
+SYSFS_HWMON_DIR = "/sys/class/hwmon"
+PROC_DIR = "/proc"
+
+_CPU_COUNT = psutil.cpu_count(logical=True) or 1
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+# /proc/<pid>/stat field positions, counted after the "(comm)" field
+_STAT_UTIME = 11
+_STAT_STIME = 12
+_STAT_STARTTIME = 19
+
+# Last temperature reading, see read_socket_temperatures(ttl=...)
+_temp_cache = {"t": 0.0, "key": None, "v": []}
+
+# Tray icon states: (char, color, name), indexed by temperature band
+_ICON_IDLE = ("C", QtCore.Qt.GlobalColor.white, "idle")
+_ICON_STATES = (
+    ("C", QtCore.Qt.GlobalColor.white, "cool"),
+    ("W", QtCore.Qt.GlobalColor.white, "warm"),
+    ("H", QtCore.Qt.GlobalColor.red, "hot"),
+)
+
+_PACKAGE_LABEL_RE = re.compile(r"Package id (\d+)$")
+_AMD_HWMON_NAMES = ("k10temp", "zenpower")
+_AMD_PACKAGE_LABELS = ("Tdie", "Tctl")  # in order of preference
+_SENSORS_RE = re.compile(r"Package id (\d+):[^\n]*?\+([0-9]+\.[0-9]+)°C")
 
 
 # ---------------------------------------------------------
-#   Parse CPU sockets from: lscpu --extended
+#   Optional NumPy (imported on first use, keeps tray startup fast)
 # ---------------------------------------------------------
-def get_socket_core_map() -> Dict[int, List[int]]:
+@functools.lru_cache(maxsize=1)
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# ---------------------------------------------------------
+#   CPU socket topology: sysfs (cached), lscpu fallback
+# ---------------------------------------------------------
+def _read_sysfs_socket_map() -> Dict[int, List[int]]:
+    socket_map: Dict[int, List[int]] = {}
+
+    for cpu_dir in glob.glob(os.path.join(SYSFS_CPU_DIR, "cpu[0-9]*")):
+        try:
+            cpu_id = int(os.path.basename(cpu_dir)[3:])
+            with open(os.path.join(cpu_dir, "topology", "physical_package_id")) as f:
+                socket_id = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+
+        socket_map.setdefault(socket_id, []).append(cpu_id)
+
+    for s in socket_map:
+        socket_map[s] = sorted(socket_map[s])
+    return socket_map
+
+
+def _read_lscpu_socket_map() -> Dict[int, List[int]]:
     socket_map: Dict[int, List[int]] = {}
 
     try:
         out = subprocess.check_output(["lscpu", "--extended"], text=True)
     except Exception:
-        return {0: list(range(psutil.cpu_count()))}
+        return {0: list(range(_CPU_COUNT))}
 
     lines = out.strip().splitlines()
     if not lines:
-        return {0: list(range(psutil.cpu_count()))}
+        return {0: list(range(_CPU_COUNT))}
 
     header = lines[0]
     cols = [c.strip().upper() for c in header.split()]
@@ -34,7 +98,7 @@ def get_socket_core_map() -> Dict[int, List[int]]:
         cpu_idx = cols.index("CPU")
         socket_idx = cols.index("SOCKET")
     except ValueError:
-        return {0: list(range(psutil.cpu_count()))}
+        return {0: list(range(_CPU_COUNT))}
 
     for line in lines[1:]:
         parts = line.split()
@@ -53,71 +117,309 @@ def get_socket_core_map() -> Dict[int, List[int]]:
     return socket_map
 
 
+def _topology_cache_key():
+    try:
+        return str(os.stat("/proc/cpuinfo").st_mtime)
+    except OSError:
+        return None
+
+
+def _load_topology_cache(key) -> Dict[int, List[int]]:
+    try:
+        with open(TOPOLOGY_CACHE_PATH, "r") as f:
+            cached = json.load(f)
+        return {int(s): list(cores) for s, cores in cached[key].items()}
+    except Exception:
+        return {}
+
+
+def _save_topology_cache(key, socket_map: Dict[int, List[int]]):
+    try:
+        os.makedirs(os.path.dirname(TOPOLOGY_CACHE_PATH), exist_ok=True)
+        with open(TOPOLOGY_CACHE_PATH, "w") as f:
+            json.dump({key: socket_map}, f)
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_socket_core_map() -> Dict[int, List[int]]:
+    # Memoized: callers share the returned dict and must not mutate it
+    key = _topology_cache_key()
+    if key is not None:
+        socket_map = _load_topology_cache(key)
+        if socket_map:
+            return socket_map
+
+    socket_map = _read_sysfs_socket_map()
+    if not socket_map:
+        # No sysfs topology (old kernel / restricted container)
+        return _read_lscpu_socket_map()
+
+    if key is not None:
+        _save_topology_cache(key, socket_map)
+    return socket_map
+
+
 # ---------------------------------------------------------
-#   Read CPU package temperatures via lm-sensors
+#   Read CPU package temperatures: hwmon sysfs, lm-sensors fallback
 # ---------------------------------------------------------
-def read_socket_temperatures() -> Dict[int, float]:
-    temps: Dict[int, float] = {}
+def _read_hwmon_labels(hwmon_dir) -> Dict[str, str]:
+    # label text -> matching tempN_input path
+    labels: Dict[str, str] = {}
+    for label_path in glob.glob(os.path.join(hwmon_dir, "temp*_label")):
+        try:
+            with open(label_path) as f:
+                labels[f.read().strip()] = label_path[: -len("_label")] + "_input"
+        except OSError:
+            continue
+    return labels
+
+
+def find_hwmon_package_inputs() -> Dict[int, str]:
+    # socket id -> tempN_input path.
+    # Intel coretemp labels each package ("Package id N"); AMD k10temp /
+    # zenpower expose one device per socket with a Tdie/Tctl sensor, so
+    # those are numbered in PCI device order.
+    inputs: Dict[int, str] = {}
+    amd = []
+
+    for hwmon_dir in glob.glob(os.path.join(SYSFS_HWMON_DIR, "hwmon*")):
+        try:
+            with open(os.path.join(hwmon_dir, "name")) as f:
+                name = f.read().strip()
+        except OSError:
+            continue
+
+        if name == "coretemp":
+            for label, path in _read_hwmon_labels(hwmon_dir).items():
+                m = _PACKAGE_LABEL_RE.match(label)
+                if m:
+                    inputs[int(m.group(1))] = path
+        elif name in _AMD_HWMON_NAMES:
+            labels = _read_hwmon_labels(hwmon_dir)
+            for label in _AMD_PACKAGE_LABELS:
+                if label in labels:
+                    device = os.path.realpath(os.path.join(hwmon_dir, "device"))
+                    amd.append((device, labels[label]))
+                    break
+
+    if not inputs:
+        for socket_id, (_, path) in enumerate(sorted(amd)):
+            inputs[socket_id] = path
+    return inputs
+
+
+def _read_hwmon_temperatures(
+    known_sockets: List[int], inputs: Dict[int, str]
+) -> List[Optional[float]]:
+    temps: List[Optional[float]] = [None] * len(known_sockets)
+    for i, socket_id in enumerate(known_sockets):
+        path = inputs.get(socket_id)
+        if path is None:
+            continue
+        try:
+            with open(path) as f:
+                temps[i] = int(f.read()) / 1000.0
+        except (OSError, ValueError):
+            continue
+    return temps
+
+
+def read_socket_temperatures(
+    known_sockets: List[int],
+    hwmon_inputs: Optional[Dict[int, str]] = None,
+    ttl: float = 0.0,
+) -> List[Optional[float]]:
+    # Result is aligned with known_sockets; None where no reading exists.
+    # Package temps move on a multi-second scale, so a reading younger
+    # than ttl seconds is reused instead of hitting hwmon/sensors again.
+    now = time.monotonic()
+    key = tuple(known_sockets)
+    if ttl > 0 and _temp_cache["key"] == key and now - _temp_cache["t"] < ttl:
+        return _temp_cache["v"]
+
+    temps = _read_socket_temperatures(known_sockets, hwmon_inputs)
+    _temp_cache.update(t=now, key=key, v=temps)
+    return temps
+
+
+def _read_socket_temperatures(
+    known_sockets: List[int], hwmon_inputs: Optional[Dict[int, str]]
+) -> List[Optional[float]]:
+    if hwmon_inputs:
+        return _read_hwmon_temperatures(known_sockets, hwmon_inputs)
 
     try:
         out = subprocess.check_output(["sensors"], text=True)
     except Exception:
-        return temps
+        return [None] * len(known_sockets)
 
-    current_socket = None
+    found = {int(s): float(t) for s, t in _SENSORS_RE.findall(out)}
+    return [found.get(s) for s in known_sockets]
 
-    for line in out.splitlines():
-        line = line.strip()
-        if "Package id 0:" in line:
-            current_socket = 0
-        elif "Package id 1:" in line:
-            current_socket = 1
 
-        if current_socket is not None and "+" in line and "°C" in line:
-            try:
-                temp_val = float(line.split("+")[1].split("°C")[0].strip())
-                temps[current_socket] = temp_val
-                current_socket = None
-            except Exception:
-                current_socket = None
+# ---------------------------------------------------------
+#   Process sampling (PID, Name, CPU%, etc.)
+# ---------------------------------------------------------
+@functools.lru_cache(maxsize=None)
+def _uid_name(uid: int) -> str:
+    # Same naming as Process.username(), without a passwd lookup per PID
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def scan_procs(prev: Dict[int, tuple]) -> List[dict]:
+    # Walk /proc directly: one stat-file read plus one stat() per PID,
+    # without building psutil.Process objects. prev maps
+    # pid -> (starttime, cpu_ticks, monotonic ts) from the last scan and is
+    # replaced in place, so CPU% is the delta since that scan.
+    # Affinity is not sampled here: the table fetches it lazily for the
+    # rows it actually paints (ProcessTableModel.affinity_str).
+    seen: Dict[int, tuple] = {}
+    data = []
+
+    for entry in os.scandir(PROC_DIR):
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        try:
+            with open(os.path.join(entry.path, "stat"), "rb") as f:
+                raw = f.read()
+            uid = entry.stat().st_uid
+        except OSError:
+            continue  # exited (ENOENT/ESRCH) or not readable (EACCES)
+        now = time.monotonic()
+
+        # comm may contain spaces/parens: it spans from the first "(" to
+        # the last ")"; the numeric fields follow it.
+        lpar = raw.find(b"(")
+        rpar = raw.rfind(b")")
+        fields = raw[rpar + 2:].split()
+        try:
+            ticks = int(fields[_STAT_UTIME]) + int(fields[_STAT_STIME])
+            start = int(fields[_STAT_STARTTIME])
+        except (IndexError, ValueError):
+            continue
+        name = raw[lpar + 1:rpar].decode(errors="replace")
 
-    return temps
+        cpu = 0.0
+        last = prev.get(pid)
+        if last is not None and last[0] == start:
+            dt = now - last[2]
+            if dt > 0:
+                cpu = (ticks - last[1]) / _CLK_TCK / dt * 100.0
+        seen[pid] = (start, ticks, now)
+
+        data.append({
+            "pid": pid,
+            "name": name,
+            "user": _uid_name(uid),
+            "cpu": cpu,
+            "cpu_str": f"{cpu:.1f}",
+        })
+
+    prev.clear()
+    prev.update(seen)
+    return data
 
 
 # ---------------------------------------------------------
-#   Process table (PID, Name, CPU%, etc.)
+#   Process table
 # ---------------------------------------------------------
 class ProcessTableModel(QtCore.QAbstractTableModel):
+    KEYS = ("pid", "name", "user", "cpu_str")  # snapshot key per stored column
+    CPU_COL = 3
+    AFF_COL = 4  # not stored: read on demand in affinity_str()
+    SORT_ROLE = QtCore.Qt.ItemDataRole.UserRole  # numeric PID / CPU% for sorting
+    AFF_CACHE_TTL = 2.0  # seconds
+    AFF_CACHE_MAX = 512  # PIDs
+    AFF_FMT_CACHE_MAX = 256  # distinct CPU sets
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.headers = ["PID", "Name", "User", "CPU %", "Affinity"]
-        self.rows = []
-
-    def update(self):
-        data = []
-        for p in psutil.process_iter(attrs=["pid", "name", "username"]):
-            try:
-                cpu = p.cpu_percent(interval=None)
-                aff = p.cpu_affinity()
-                aff_str = ",".join(str(c) for c in aff)
-                data.append({
-                    "pid": p.info["pid"],
-                    "name": p.info.get("name", ""),
-                    "user": p.info.get("username", ""),
-                    "cpu": cpu,
-                    "aff": aff_str,
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+        # Column-wise storage (one list per column, indexed by row);
+        # the named lists alias self.columns and are only mutated in place.
+        self.columns: List[list] = [[] for _ in self.KEYS]
+        self.pids, self.names, self.users, self.cpu_strs = self.columns
+        self.cpus: List[float] = []  # sort key behind cpu_strs
+        self.pid_strs: List[str] = []  # display text for pids, built once per PID
+
+        # pid -> (affinity text, fetch time), LRU-bounded; plus one
+        # formatted string per distinct CPU set
+        self._aff_cache: "collections.OrderedDict[int, tuple]" = collections.OrderedDict()
+        self._aff_fmt_cache: Dict[frozenset, str] = {}
+
+    def update(self, rows: List[dict]):
+        # Incremental update: preserves selection/scroll and only repaints
+        # what changed instead of resetting the whole model every tick.
+        # Rows stay in arrival order; sorting is left to the view's proxy.
+        new_by_pid = {r["pid"]: r for r in rows}
+        pids = self.pids
+
+        # 1) Remove vanished PIDs, in contiguous ranges from the bottom up
+        r = len(pids) - 1
+        while r >= 0:
+            if pids[r] in new_by_pid:
+                r -= 1
                 continue
-
-        data.sort(key=lambda x: x["cpu"], reverse=True)
-
-        self.beginResetModel()
-        self.rows = data
-        self.endResetModel()
+            last = r
+            while r >= 0 and pids[r] not in new_by_pid:
+                r -= 1
+            self.beginRemoveRows(QtCore.QModelIndex(), r + 1, last)
+            for pid in pids[r + 1:last + 1]:
+                self._aff_cache.pop(pid, None)
+            for column in self.columns:
+                del column[r + 1:last + 1]
+            del self.cpus[r + 1:last + 1]
+            del self.pid_strs[r + 1:last + 1]
+            self.endRemoveRows()
+
+        # 2) Update kept PIDs in place (the PID column never changes).
+        # One bounding-box dataChanged so the sorting proxy re-sorts once.
+        rmin = rmax = cmax = -1
+        cmin = len(self.KEYS)
+        cpu_col = self.CPU_COL
+        for i, pid in enumerate(pids):
+            new = new_by_pid[pid]
+            changed = False
+            for c in range(1, len(self.KEYS)):
+                value = new[self.KEYS[c]]
+                column = self.columns[c]
+                if column[i] != value:
+                    column[i] = value
+                    changed = True
+                    if c < cmin:
+                        cmin = c
+                    if c > cmax:
+                        cmax = c
+                    if c == cpu_col:
+                        # Sort key only moves when the displayed value does
+                        self.cpus[i] = new["cpu"]
+            if changed:
+                if rmax < 0:
+                    rmin = i
+                rmax = i
+        if rmax >= 0:
+            self.dataChanged.emit(self.index(rmin, cmin), self.index(rmax, cmax))
+
+        # 3) Append new PIDs
+        known = set(pids)
+        added = [r for r in rows if r["pid"] not in known]
+        if added:
+            first = len(pids)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            for column, key in zip(self.columns, self.KEYS):
+                column.extend(r[key] for r in added)
+            self.cpus.extend(r["cpu"] for r in added)
+            self.pid_strs.extend(str(r["pid"]) for r in added)
+            self.endInsertRows()
 
     def rowCount(self, parent=None):
-        return len(self.rows)
+        return len(self.pids)
 
     def columnCount(self, parent=None):
         return len(self.headers)
@@ -126,26 +428,62 @@ class ProcessTableModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
 
-        row = self.rows[index.row()]
+        # Display text is preformatted in update(); nothing is formatted here
         col = index.column()
-
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
             if col == 0:
-                return str(row["pid"])
-            if col == 1:
-                return row["name"]
-            if col == 2:
-                return row["user"]
-            if col == 3:
-                return f"{row['cpu']:.1f}"
-            if col == 4:
-                return row["aff"]
+                return self.pid_strs[index.row()]
+            if col == self.AFF_COL:
+                return self.affinity_str(self.pids[index.row()])
+            return self.columns[col][index.row()]
+        if role == self.SORT_ROLE:
+            if col == self.CPU_COL:
+                return self.cpus[index.row()]
+            if col == self.AFF_COL:
+                # Sorting would read every PID's mask; keep it on-demand
+                return None
+            return self.columns[col][index.row()]
 
         return None
 
+    def affinity_str(self, pid):
+        # sched_getaffinity only for rows Qt asks about, reused for a while
+        now = time.monotonic()
+        entry = self._aff_cache.get(pid)
+        if entry is not None and now - entry[1] <= self.AFF_CACHE_TTL:
+            self._aff_cache.move_to_end(pid)
+            return entry[0]
+
+        try:
+            aff = frozenset(os.sched_getaffinity(pid))
+        except OSError:
+            return entry[0] if entry is not None else ""
+
+        text = self._aff_fmt_cache.get(aff)
+        if text is None:
+            if len(self._aff_fmt_cache) > self.AFF_FMT_CACHE_MAX:
+                self._aff_fmt_cache.clear()
+            text = self._aff_fmt_cache[aff] = ",".join(map(str, sorted(aff)))
+
+        self._aff_cache[pid] = (text, now)
+        self._aff_cache.move_to_end(pid)
+        if len(self._aff_cache) > self.AFF_CACHE_MAX:
+            self._aff_cache.popitem(last=False)
+        return text
+
+    def invalidate_affinity(self, pid):
+        # Called after we change a PID's affinity, so the cell repaints now
+        self._aff_cache.pop(pid, None)
+        try:
+            row = self.pids.index(pid)
+        except ValueError:
+            return
+        idx = self.index(row, self.AFF_COL)
+        self.dataChanged.emit(idx, idx)
+
     def get_pid_at(self, row):
-        if 0 <= row < len(self.rows):
-            return self.rows[row]["pid"]
+        if 0 <= row < len(self.pids):
+            return self.pids[row]
         return -1
 
 
@@ -155,15 +493,29 @@ class ProcessTableModel(QtCore.QAbstractTableModel):
 class TempTableModel(QtCore.QAbstractTableModel):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.rows = []
+        self.socket_ids: List[int] = []
+        # Display strings, formatted once per update rather than per paint
+        self.socket_strs: List[str] = []
+        self.temp_strs: List[str] = []
+
+    def update(self, socket_ids: List[int], temps: List[Optional[float]]):
+        temp_strs = ["n/a" if t is None else f"{t:.1f}" for t in temps]
+
+        # Socket list is fixed after startup: only the values change
+        if socket_ids == self.socket_ids:
+            if temp_strs != self.temp_strs:
+                self.temp_strs = temp_strs
+                self.dataChanged.emit(self.index(0, 1), self.index(len(temps) - 1, 1))
+            return
 
-    def update(self, temps: Dict[int, float]):
         self.beginResetModel()
-        self.rows = [{"socket": s, "temp": temps[s]} for s in sorted(temps.keys())]
+        self.socket_ids = list(socket_ids)
+        self.socket_strs = [str(s) for s in socket_ids]
+        self.temp_strs = temp_strs
         self.endResetModel()
 
     def rowCount(self, parent=None):
-        return len(self.rows)
+        return len(self.socket_ids)
 
     def columnCount(self, parent=None):
         return 2
@@ -172,34 +524,184 @@ class TempTableModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
 
-        row = self.rows[index.row()]
+        r = index.row()
         col = index.column()
 
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
             if col == 0:
-                return str(row["socket"])
+                return self.socket_strs[r]
             if col == 1:
-                return f"{row['temp']:.1f}"
+                return self.temp_strs[r]
 
         return None
 
 
+# ---------------------------------------------------------
+#   Per-core load bar (painted, no per-cell widgets)
+# ---------------------------------------------------------
+class LoadBarDelegate(QtWidgets.QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        value = index.data(QtCore.Qt.ItemDataRole.UserRole)
+        if value is None:
+            super().paint(painter, option, index)
+            return
+
+        opt = QtWidgets.QStyleOptionProgressBar()
+        opt.rect = option.rect
+        opt.state = option.state | QtWidgets.QStyle.StateFlag.State_Horizontal
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = value
+        opt.text = f"{value}%"
+        opt.textVisible = True
+        QtWidgets.QApplication.style().drawControl(
+            QtWidgets.QStyle.ControlElement.CE_ProgressBar, opt, painter
+        )
+
+
+# ---------------------------------------------------------
+#   Background sampler (runs in its own QThread)
+# ---------------------------------------------------------
+class SamplerWorker(QtCore.QObject):
+    sampled = QtCore.pyqtSignal(dict)
+
+    FULL_PERIOD_MS = 2000  # sensors + per-core loads at most this often
+
+    def __init__(self, interval_ms, socket_ids, hwmon_inputs=None, temp_ttl=0.0):
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.socket_ids = socket_ids
+        self.hwmon_inputs = hwmon_inputs or {}
+        self.temp_ttl = temp_ttl
+        self.timer = None
+        self.proc_prev: Dict[int, tuple] = {}
+        self.idle_gate = 0.0  # busy cores at/below which the /proc scan is skipped
+        self.want_procs = True  # off: paused with auto-pin disabled
+        self.want_full = True  # off: paused, sensors/core loads unused
+        self._tick = 0
+
+    @QtCore.pyqtSlot()
+    def start(self):
+        # Created here so the timer lives in the worker thread
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(self.interval_ms)
+
+    @QtCore.pyqtSlot(int, float, bool, bool)
+    def set_mode(self, interval_ms, idle_gate, want_procs, want_full):
+        self.interval_ms = interval_ms
+        self.want_procs = want_procs
+        self.want_full = want_full
+        if idle_gate > 0 and self.idle_gate <= 0:
+            # Restart the system-wide baseline so the first gated tick
+            # measures one interval, not the time since the last slow spell
+            self._system_busy_cores()
+        self.idle_gate = idle_gate
+        if self.timer is not None:
+            self.timer.setInterval(interval_ms)
+
+    @QtCore.pyqtSlot()
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+
+    @QtCore.pyqtSlot()
+    def tick(self):
+        self._tick += 1
+        every = max(1, self.FULL_PERIOD_MS // self.interval_ms)
+        full = self.want_full and self._tick % every == 0
+        if not (self.want_procs or full):
+            return  # nothing would consume this tick's sample
+        self.sampled.emit(self._snapshot(full, autopin=True, gated=True))
+
+    @QtCore.pyqtSlot()
+    def sample(self):
+        # Out-of-cycle refresh: full snapshot, not counted by the autopin engine
+        self.sampled.emit(self._snapshot(True, autopin=False))
+
+    def _snapshot(self, full, autopin, gated=False):
+        # No Qt widgets may be touched here: only plain data is emitted.
+        # One /proc scan per tick feeds both the process table and the
+        # autopin engine. After skipped ticks the first scan averages each
+        # PID over the whole gap, so a process that just got hot is only
+        # counted from the following tick (one extra slow interval).
+        procs = None
+        if not (gated and self.idle_gate > 0 and self._system_busy_cores() <= self.idle_gate):
+            procs = scan_procs(self.proc_prev)
+        snapshot = {
+            "ts": time.monotonic(),
+            "procs": procs,  # None: skipped, the whole box was idle
+            "full": full,
+            "autopin": autopin,
+        }
+        if full:
+            snapshot["temps"] = read_socket_temperatures(
+                self.socket_ids, self.hwmon_inputs, self.temp_ttl
+            )
+            snapshot["cores"] = psutil.cpu_percent(interval=None, percpu=True)
+        return snapshot
+
+    @staticmethod
+    def _system_busy_cores():
+        # Busy core-equivalents since the previous call from this (worker)
+        # thread: one /proc/stat read.
+        # No single process can use more CPU than the whole system did.
+        return psutil.cpu_percent(interval=None) / 100.0 * _CPU_COUNT
+
+
+# ---------------------------------------------------------
+#   Tray icons (rasterized once per process, on first use)
+# ---------------------------------------------------------
+def _make_icon_pixmap(char, color):
+    pix = QPixmap(32, 32)
+    pix.fill(QtCore.Qt.GlobalColor.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    f = QFont()
+    f.setPointSize(18)
+    painter.setFont(f)
+    painter.setPen(color)
+    painter.drawText(pix.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, char)
+    painter.end()
+    return pix
+
+
+@functools.lru_cache(maxsize=1)
+def get_tray_icons() -> Dict[str, QIcon]:
+    # Lazy because pixmaps need a live QApplication
+    return {
+        state: QIcon(_make_icon_pixmap(char, col))
+        for char, col, state in (_ICON_IDLE,) + _ICON_STATES
+    }
+
+
 # ---------------------------------------------------------
 #   Main GUI window
 # ---------------------------------------------------------
 class MainWindow(QtWidgets.QMainWindow):
+    sample_requested = QtCore.pyqtSignal()
+    sampling_mode_requested = QtCore.pyqtSignal(int, float, bool, bool)
+
     HIGH_CPU_THRESHOLD = 100.0
     HIGH_CPU_DURATION = 10  # seconds above threshold
+    FAST_INTERVAL_MS = 1000  # window open or an autopin candidate exists
+    SLOW_INTERVAL_MS = 5000  # hidden to tray and nothing near threshold
+    AUTOPIN_TOP_K = 20  # only the busiest snapshot rows are considered
+    TEMP_TTL = 4.0  # seconds a temperature reading is reused
 
     def __init__(self, socket_map):
         super().__init__()
         self.socket_map = socket_map
+        self.socket_ids = sorted(socket_map)
+        # Pin targets built once; also used for subset checks in autopin
+        self.socket_cores_set = {s: frozenset(cs) for s, cs in socket_map.items()}
         self.setWindowTitle("CPU Affinity Manager")
         self.statusBar()
 
         # Track CPU usage durations & autopinned PIDs
-        self.high_usage_counter: Dict[int, int] = {}
+        self.high_usage_counter: Dict[int, float] = {}  # pid -> seconds heavy
         self.autopinned_pids = set()
+        self.last_snapshot: List[dict] = []
 
         # Cooler socket & tray icon state
         self.current_cooler_socket = None
@@ -208,13 +710,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # Settings
         self.settings = self._load_settings()
 
+        # hwmon discovery happens once; ticks only read the tempN_input files
+        self.hwmon_inputs = find_hwmon_package_inputs()
+
         # ---------------- GUI LAYOUT ----------------
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
         layout = QtWidgets.QVBoxLayout(central)
 
         # Socket info
-        self.socket_label = QtWidgets.QLabel(self._format_socket_info())
+        self.socket_label = QtWidgets.QLabel(self._socket_info_text)
         layout.addWidget(self.socket_label)
 
         # Temperature table
@@ -231,6 +736,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.core_table.setColumnCount(2)
         self.core_table.setHorizontalHeaderLabels(["Core", "Load %"])
         self.core_table.horizontalHeader().setStretchLastSection(True)
+        self.core_table.setItemDelegateForColumn(1, LoadBarDelegate(self.core_table))
+        self._core_items: List[tuple] = []
+        self._core_rows_shown = 0
         layout.addWidget(self.core_table)
 
         # Checkboxes
@@ -244,6 +752,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.chk_auto_heavy.setChecked(self.settings.get("auto_heavy", False))
         layout.addWidget(self.chk_auto_heavy)
 
+        # Connected after restoring state so loading doesn't mark them dirty
+        self._settings_dirty = False
+        self.chk_pause.stateChanged.connect(self._on_setting_changed)
+        self.chk_auto_heavy.stateChanged.connect(self._on_setting_changed)
+
         # Exit button
         self.btn_exit_full = QtWidgets.QPushButton("Exit Application")
         self.btn_exit_full.setStyleSheet("background-color:#b33a3a; color:white;")
@@ -253,8 +766,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # Process table
         layout.addWidget(QtWidgets.QLabel("Processes:"))
         self.table_model = ProcessTableModel(self)
+        # Qt sorts in C++ through the proxy; the source model never reorders
+        self.table_proxy = QtCore.QSortFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.table_proxy.setSortRole(ProcessTableModel.SORT_ROLE)
         self.table_view = QtWidgets.QTableView()
-        self.table_view.setModel(self.table_model)
+        self.table_view.setModel(self.table_proxy)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(
+            ProcessTableModel.CPU_COL, QtCore.Qt.SortOrder.DescendingOrder
+        )
         self.table_view.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.table_view)
 
@@ -269,16 +790,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_pin_socket0.clicked.connect(self.pin_socket0)
         self.btn_pin_socket1.clicked.connect(self.pin_socket1)
 
-        # Timers
-        self.update_timer = QtCore.QTimer(self)
-        self.update_timer.timeout.connect(self.refresh_all)
-        self.update_timer.start(2000)
-
-        self.autopin_timer = QtCore.QTimer(self)
-        self.autopin_timer.timeout.connect(self.autopin_tick)
-        self.autopin_timer.start(1000)
+        # Sampler thread: sensors + /proc scans run off the GUI thread
+        self._sample_pending = False
+        self.sampler_thread = QtCore.QThread(self)
+        self.sampler = SamplerWorker(
+            self.FAST_INTERVAL_MS, self.socket_ids, self.hwmon_inputs, self.TEMP_TTL
+        )
+        self.sampler.moveToThread(self.sampler_thread)
+        self.sampler_thread.started.connect(self.sampler.start)
+        self.sampler.sampled.connect(self._apply_snapshot)
+        self.sample_requested.connect(self.sampler.sample)
+        self.sampling_mode_requested.connect(self.sampler.set_mode)
+        self._sample_interval = self.FAST_INTERVAL_MS
+        self._sampling_mode = (self.FAST_INTERVAL_MS, 0.0, True, True)
+        self._autopin_ts = None
+        self.sampler_thread.start()
+        self._update_sampling_mode()
 
         # Tray icon
+        self._tray_icons = get_tray_icons()
         self.tray_icon = self._create_tray_icon()
         self.tray_icon.show()
 
@@ -294,36 +824,34 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
         return {}
 
+    def _on_setting_changed(self, _state):
+        self._settings_dirty = True
+        self._save_settings()
+        self._update_sampling_mode()
+
     def _save_settings(self):
+        if not self._settings_dirty:
+            return
+
         data = {
             "auto_heavy": self.chk_auto_heavy.isChecked(),
             "pause": self.chk_pause.isChecked(),
         }
+        # Write-then-rename so a kill mid-write can't leave a torn config
+        tmp = CONFIG_PATH + ".tmp"
         try:
-            with open(CONFIG_PATH, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(tmp, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, CONFIG_PATH)
+            self._settings_dirty = False
         except Exception:
             pass
 
     # ---------------------------------------------------------
     # TRAY ICON
     # ---------------------------------------------------------
-    def _make_icon_pixmap(self, char, color):
-        pix = QPixmap(32, 32)
-        pix.fill(QtCore.Qt.GlobalColor.transparent)
-        painter = QPainter(pix)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        f = QFont()
-        f.setPointSize(18)
-        painter.setFont(f)
-        painter.setPen(color)
-        painter.drawText(pix.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, char)
-        painter.end()
-        return pix
-
     def _create_tray_icon(self):
-        pix = self._make_icon_pixmap("C", QtCore.Qt.GlobalColor.white)
-        tray = QtWidgets.QSystemTrayIcon(QIcon(pix), self)
+        tray = QtWidgets.QSystemTrayIcon(self._tray_icons["idle"], self)
 
         menu = QtWidgets.QMenu()
 
@@ -348,28 +876,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_tray_icon(self, max_temp):
         if max_temp is None:
-            state = "idle"
-            char = "C"
-            col = QtCore.Qt.GlobalColor.white
+            state = _ICON_IDLE[2]
         else:
-            if max_temp <= 55:
-                state = "cool"
-                char = "C"
-                col = QtCore.Qt.GlobalColor.white
-            elif max_temp <= 70:
-                state = "warm"
-                char = "W"
-                col = QtCore.Qt.GlobalColor.white
-            else:
-                state = "hot"
-                char = "H"
-                col = QtCore.Qt.GlobalColor.red
+            # <=55 cool, <=70 warm, else hot
+            state = _ICON_STATES[(max_temp > 55) + (max_temp > 70)][2]
 
         if state == self.last_icon_state:
             return
 
-        pix = self._make_icon_pixmap(char, col)
-        self.tray_icon.setIcon(QIcon(pix))
+        self.tray_icon.setIcon(self._tray_icons[state])
         if max_temp is not None:
             self.tray_icon.setToolTip(f"Max temp: {max_temp:.1f} °C")
         else:
@@ -387,6 +902,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.showNormal()
         self.raise_()
         self.activateWindow()
+        # Tables were not updated while hidden
+        self._update_sampling_mode()
+        self.refresh_all()
 
     def hide_from_tray(self):
         self.hide()
@@ -394,7 +912,10 @@ class MainWindow(QtWidgets.QMainWindow):
     # ---------------------------------------------------------
     # FORMAT SOCKET INFO
     # ---------------------------------------------------------
-    def _format_socket_info(self):
+    # Depends only on the startup topology; `del self._socket_info_text`
+    # recomputes it should socket_map ever change (CPU hot-plug).
+    @functools.cached_property
+    def _socket_info_text(self):
         lines = []
         for s, cores in sorted(self.socket_map.items()):
             core_list = ", ".join(str(c) for c in cores)
@@ -414,12 +935,11 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
 
         try:
-            self.update_timer.stop()
-        except Exception:
-            pass
-
-        try:
-            self.autopin_timer.stop()
+            QtCore.QMetaObject.invokeMethod(
+                self.sampler, "stop", QtCore.Qt.ConnectionType.BlockingQueuedConnection
+            )
+            self.sampler_thread.quit()
+            self.sampler_thread.wait()
         except Exception:
             pass
 
@@ -434,20 +954,53 @@ class MainWindow(QtWidgets.QMainWindow):
     # UPDATE FUNCTIONS
     # ---------------------------------------------------------
     def refresh_all(self):
-        if self.chk_pause.isChecked():
+        # Ask the sampler for an out-of-cycle snapshot (queued to its
+        # thread). Drop the request if one is still pending, so repeated
+        # clicks can't stack up full /proc scans behind each other.
+        if self._sample_pending:
+            return
+        self._sample_pending = True
+        self.sample_requested.emit()
+
+    def _apply_snapshot(self, snapshot):
+        if not snapshot["autopin"]:
+            self._sample_pending = False
+        procs = snapshot["procs"]
+        if procs is not None:
+            self.last_snapshot = procs
+        if snapshot["autopin"]:
+            # Counters accumulate real time, so a variable tick keeps the
+            # HIGH_CPU_DURATION meaning
+            ts = snapshot["ts"]
+            last = self._autopin_ts
+            self._autopin_ts = ts
+            dt = ts - last if last is not None else self._sample_interval / 1000.0
+            if procs is None:
+                # Scan skipped: the system as a whole stayed under threshold
+                self.high_usage_counter.clear()
+            else:
+                self.autopin_tick(dt)
+            self._update_sampling_mode()
+
+        if not snapshot["full"] or self.chk_pause.isChecked():
             return
 
         # Socket temps
-        temps = read_socket_temperatures()
-        self.temp_model.update(temps)
+        temps = snapshot["temps"]
+        self.temp_model.update(self.socket_ids, temps)
 
-        # Determine cooler socket
+        # Determine cooler socket and max temp in one pass
         new_cooler = None
-        if temps:
-            new_cooler = min(temps.keys(), key=lambda s: temps[s])
-        else:
-            if 0 in self.socket_map:
-                new_cooler = 0
+        min_temp = max_temp = None
+        for s, t in zip(self.socket_ids, temps):
+            if t is None:
+                continue
+            if min_temp is None or t < min_temp:
+                new_cooler, min_temp = s, t
+            if max_temp is None or t > max_temp:
+                max_temp = t
+        if new_cooler is None and 0 in self.socket_map:
+            new_cooler = 0
 
         # If cooler socket changed, re-pin auto-managed PIDs
         if new_cooler != self.current_cooler_socket:
@@ -457,51 +1010,74 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._on_cooler_socket_changed(old, new_cooler)
 
         # Update tray icon
-        max_temp = max(temps.values()) if temps else None
         self._update_tray_icon(max_temp)
 
+        # Hidden to tray: nobody sees the tables, skip filling them
+        if not self.isVisible():
+            return
+
         # Per-core loads
-        self._update_core_loads()
+        self._update_core_loads(snapshot["cores"])
 
         # Process table
-        self.table_model.update()
-
-    def _update_core_loads(self):
-        percs = psutil.cpu_percent(interval=None, percpu=True)
+        if procs is not None:
+            self.table_model.update(procs)
 
+    def _update_core_loads(self, percs):
         # Keep only active cores, sort by descending usage
-        core_data = [(i, p) for i, p in enumerate(percs) if p > 0]
-        core_data.sort(key=lambda x: x[1], reverse=True)
+        np = _load_numpy()
+        if np is not None:
+            arr = np.asarray(percs, dtype=np.float32)
+            active = np.nonzero(arr > 0)[0]
+            order = active[np.argsort(-arr[active], kind="stable")]
+            core_data = list(zip(order.tolist(), arr[order].tolist()))
+        else:
+            core_data = [(i, p) for i, p in enumerate(percs) if p > 0]
+            core_data.sort(key=lambda x: x[1], reverse=True)
 
-        self.core_table.setRowCount(len(core_data))
+        if len(self._core_items) != len(percs):
+            self._init_core_rows(len(percs))
 
         for row, (core_id, val) in enumerate(core_data):
-            item = QtWidgets.QTableWidgetItem(str(core_id))
-            item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
-            self.core_table.setItem(row, 0, item)
-
-            bar = QtWidgets.QProgressBar()
-            bar.setRange(0, 100)
-            bar.setValue(int(val))
-            bar.setTextVisible(True)
-            self.core_table.setCellWidget(row, 1, bar)
+            id_item, load_item = self._core_items[row]
+            id_item.setText(str(core_id))
+            load_item.setData(QtCore.Qt.ItemDataRole.UserRole, int(val))
+
+        # Rows are preallocated; idle cores are hidden rather than removed
+        shown = len(core_data)
+        for row in range(min(shown, self._core_rows_shown), max(shown, self._core_rows_shown)):
+            self.core_table.setRowHidden(row, row >= shown)
+        self._core_rows_shown = shown
+
+    def _init_core_rows(self, count):
+        self.core_table.setRowCount(count)
+        self._core_items = []
+        for row in range(count):
+            items = (QtWidgets.QTableWidgetItem(), QtWidgets.QTableWidgetItem())
+            for col, item in enumerate(items):
+                item.setFlags(item.flags() & ~QtCore.Qt.ItemFlag.ItemIsEditable)
+                self.core_table.setItem(row, col, item)
+            self.core_table.setRowHidden(row, True)
+            self._core_items.append(items)
+        self._core_rows_shown = 0
 
     # ---------------------------------------------------------
     # COOLER SOCKET CHANGE HANDLING
     # ---------------------------------------------------------
     def _on_cooler_socket_changed(self, old_socket, new_socket):
         print(f"[INFO] Cooler socket changed {old_socket} → {new_socket}")
-        target = self.socket_map.get(new_socket)
-        if not target:
+        target_set = self.socket_cores_set.get(new_socket)
+        if not target_set:
             return
 
         for pid in list(self.autopinned_pids):
             try:
-                psutil.Process(pid).cpu_affinity(target)
+                os.sched_setaffinity(pid, target_set)
+                self.table_model.invalidate_affinity(pid)
                 print(f"[RE-PIN] PID {pid} moved to socket {new_socket}")
-            except psutil.NoSuchProcess:
+            except ProcessLookupError:
                 self.autopinned_pids.discard(pid)
-            except Exception:
+            except OSError:
                 continue
 
         self.statusBar().showMessage(
@@ -516,31 +1092,57 @@ class MainWindow(QtWidgets.QMainWindow):
         sel = self.table_view.selectionModel().selectedRows()
         if not sel:
             return -1
-        return self.table_model.get_pid_at(sel[0].row())
+        src = self.table_proxy.mapToSource(sel[0])
+        return self.table_model.get_pid_at(src.row())
 
     def pin_socket0(self):
-        pid = self.selected_pid()
-        if pid >= 0 and 0 in self.socket_map:
-            try:
-                psutil.Process(pid).cpu_affinity(self.socket_map[0])
-            except Exception:
-                pass
-            self.refresh_all()
+        self._pin_selected(0)
 
     def pin_socket1(self):
+        self._pin_selected(1)
+
+    def _pin_selected(self, socket_id):
         pid = self.selected_pid()
-        if pid >= 0 and 1 in self.socket_map:
+        cores = self.socket_cores_set.get(socket_id)
+        if pid >= 0 and cores:
             try:
-                psutil.Process(pid).cpu_affinity(self.socket_map[1])
-            except Exception:
+                os.sched_setaffinity(pid, cores)
+                self.table_model.invalidate_affinity(pid)
+            except OSError:
                 pass
             self.refresh_all()
 
     # ---------------------------------------------------------
     # AUTO-PIN ENGINE
     # ---------------------------------------------------------
-    def autopin_tick(self):
+    def _update_sampling_mode(self):
+        # Back off polling while nobody looks and nothing is heating up.
+        # In that mode the /proc scan is also skipped whenever the whole
+        # system used no more than HIGH_CPU_THRESHOLD worth of CPU.
+        # While paused, sensors are not read; with auto-pin also off the
+        # sampler does no work at all.
+        fast = self.isVisible() or bool(self.high_usage_counter)
+        interval = self.FAST_INTERVAL_MS if fast else self.SLOW_INTERVAL_MS
+        idle_gate = 0.0 if fast else self.HIGH_CPU_THRESHOLD / 100.0
+        paused = self.chk_pause.isChecked()
+        want_procs = not paused or self.chk_auto_heavy.isChecked()
+        mode = (interval, idle_gate, want_procs, not paused)
+        if mode != self._sampling_mode:
+            if want_procs and not self._sampling_mode[2]:
+                # Ticks resume after a gap: don't count it as heavy time
+                self._autopin_ts = None
+            self._sampling_mode = mode
+            self._sample_interval = interval
+            self.sampling_mode_requested.emit(*mode)
+
+    def autopin_tick(self, dt):
+        # Forget dead PIDs so a reused PID is never re-pinned by mistake
+        if self.autopinned_pids:
+            self.autopinned_pids.intersection_update(r["pid"] for r in self.last_snapshot)
+
         if not self.chk_auto_heavy.isChecked():
+            # Stale counts would otherwise fire early once re-enabled
+            self.high_usage_counter.clear()
             return
 
         cooler = self.current_cooler_socket
@@ -550,39 +1152,60 @@ class MainWindow(QtWidgets.QMainWindow):
             else:
                 return
 
-        target = self.socket_map.get(cooler)
-        if not target:
+        target_set = self.socket_cores_set.get(cooler)
+        if not target_set:
             return
 
-        for p in psutil.process_iter(attrs=["pid", "name"]):
-            try:
-                pid = p.pid
-                cpu = p.cpu_percent(interval=None)
+        # Only the few heaviest rows matter: filter, then sort just those.
+        # PIDs that dropped out lose their counter (rebuilt each tick).
+        heavy = [r for r in self.last_snapshot if r["cpu"] > self.HIGH_CPU_THRESHOLD]
+        heavy.sort(key=lambda r: r["cpu"], reverse=True)
+        del heavy[self.AUTOPIN_TOP_K:]
+
+        counters = {}
+        for row in heavy:
+            pid = row["pid"]
+            counters[pid] = self.high_usage_counter.get(pid, 0.0) + dt
+        self.high_usage_counter = counters
 
-                if cpu > self.HIGH_CPU_THRESHOLD:
-                    self.high_usage_counter[pid] = self.high_usage_counter.get(pid, 0) + 1
-                else:
-                    self.high_usage_counter[pid] = 0
+        pinned = []
+        for row in heavy:
+            try:
+                pid = row["pid"]
 
                 if self.high_usage_counter[pid] >= self.HIGH_CPU_DURATION:
-                    p.cpu_affinity(target)
-                    name = p.info.get("name", "?")
-
-                    print(
-                        f"[AUTO-PIN] {pid} ({name}) >{self.HIGH_CPU_THRESHOLD}% for "
-                        f"{self.HIGH_CPU_DURATION}s → socket {cooler}"
-                    )
-                    self.statusBar().showMessage(
-                        f"Auto-pinned {pid} ({name}) to socket {cooler}",
-                        5000,
-                    )
-
-                    self.high_usage_counter[pid] = 0
+                    # Already confined to the cooler socket: no syscall or
+                    # log line, but still managed on the next socket change
+                    if os.sched_getaffinity(pid) <= target_set:
+                        self.high_usage_counter[pid] = 0.0
+                        self.autopinned_pids.add(pid)
+                        continue
+
+                    os.sched_setaffinity(pid, target_set)
+                    self.table_model.invalidate_affinity(pid)
+                    pinned.append((pid, row["name"]))
+
+                    self.high_usage_counter[pid] = 0.0
                     self.autopinned_pids.add(pid)
 
             except Exception:
                 continue
 
+        # One log line and one status-bar update per tick, however many pins
+        if pinned:
+            procs_str = ", ".join(f"{pid} ({name})" for pid, name in pinned)
+            print(
+                f"[AUTO-PIN] {procs_str} >{self.HIGH_CPU_THRESHOLD}% for "
+                f"{self.HIGH_CPU_DURATION}s → socket {cooler}"
+            )
+            shown = ", ".join(f"{name}({pid})" for pid, name in pinned[:5])
+            if len(pinned) > 5:
+                shown += ", …"
+            self.statusBar().showMessage(
+                f"Auto-pinned {len(pinned)} process(es) to socket {cooler}: {shown}",
+                5000,
+            )
+
 
 # ---------------------------------------------------------
 #   MAIN ENTRY